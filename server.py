@@ -36,15 +36,34 @@ import requests
 import queue
 import hashlib
 import subprocess
+import atexit
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Tuple
 from datetime import datetime, date, timedelta
 from functools import wraps
 from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import aiohttp
 import schedule
 
+# Optional uvloop — faster event loop for the shared async API loop
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+# Optional fast JSON codec — decodes bytes directly, no str round-trip
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ─── Configuration ───────────────────────────────────────────────
 
 app = Flask(__name__)
@@ -64,6 +83,50 @@ DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 CLOUDFANG_HEALTH_URL = "https://openfang-production.up.railway.app/api/health"
 
+# ─── Pooled HTTP Client ──────────────────────────────────────────
+# One keep-alive session for every sync call (GitHub, Discord, OpenFang) so
+# daemons reuse sockets instead of a fresh TCP+TLS handshake per request.
+# Retry covers idempotent methods only — POSTs are never replayed — and
+# ignores Retry-After so a long 429 can't park a daemon thread for minutes
+# (worst case is the 0/2/4s backoff).
+# Health probes use _http_probe instead: no retries, so a single timeout or
+# 5xx is reported as-is rather than masked.
+
+def _build_http_session(retries=True) -> requests.Session:
+    if retries:
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+    else:
+        retry = Retry(total=0, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+_http = _build_http_session()
+_http_probe = _build_http_session(retries=False)
+
+
+def _json_loads(data):
+    """Parse a JSON response body (bytes) with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
 # ─── Global State ────────────────────────────────────────────────
 
 class SystemState:
@@ -240,13 +303,61 @@ NEW CAPABILITIES (Leviathan Suite):
 
 # ─── Async API Callers ───────────────────────────────────────────
 
-def run_async(coro):
-    """Run async coroutine from sync Flask context."""
-    loop = asyncio.new_event_loop()
+# All async API calls run on ONE long-lived event loop thread, and every caller
+# on it shares one pooled ClientSession. Flask handlers and daemons submit work
+# via run_async() instead of building (and tearing down) a fresh loop + session
+# per call, so keep-alive connections survive across requests.
+_shared_aiohttp_session = None  # created lazily, only touched from the loop thread
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+
+def _new_aiohttp_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=64, limit_per_host=32, keepalive_timeout=75, enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=120))
+
+
+@contextlib.asynccontextmanager
+async def _http_session():
+    """Yield the shared session, creating it on first use. Loop thread only."""
+    global _shared_aiohttp_session
+    if _shared_aiohttp_session is None or _shared_aiohttp_session.closed:
+        _shared_aiohttp_session = _new_aiohttp_session()
+    yield _shared_aiohttp_session
+
+
+def _get_async_loop():
+    """Start the shared event loop thread on first use."""
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            loop = uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True, name="AsyncLoop").start()
+            _async_loop = loop
+        return _async_loop
+
+
+@atexit.register
+def _close_async_loop():
+    """Close the shared session on its own loop so pooled sockets shut cleanly."""
+    if _async_loop is None or _shared_aiohttp_session is None or _shared_aiohttp_session.closed:
+        return
     try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+        asyncio.run_coroutine_threadsafe(_shared_aiohttp_session.close(), _async_loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Failed to close aiohttp session: {e}")
+    _async_loop.call_soon_threadsafe(_async_loop.stop)
+
+
+def run_async(coro):
+    """Run async coroutine from sync Flask context (blocks until it completes).
+
+    Must not be called from the async loop thread itself.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_async_loop())
+    return future.result()
 
 
 async def call_deepseek_r1(prompt: str, system: str = None, max_tokens: int = 4096) -> dict:
@@ -266,7 +377,7 @@ async def call_deepseek_r1(prompt: str, system: str = None, max_tokens: int = 40
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            async with aiohttp.ClientSession() as session:
+            async with _http_session() as session:
                 async with session.post(
                     DEEPSEEK_API_URL,
                     headers={"Authorization": f"Bearer {DEEPSEEK_API_KEY}", "Content-Type": "application/json"},
@@ -336,7 +447,7 @@ async def call_gemini_via_openrouter(
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with _http_session() as session:
                 async with session.post(
                     OPENROUTER_API_URL,
                     headers={
@@ -390,7 +501,7 @@ async def call_subagent(task: str, model: str = "deepseek/deepseek-chat", max_to
     max_retries = 2
     for attempt in range(max_retries):
         try:
-            async with aiohttp.ClientSession() as session:
+            async with _http_session() as session:
                 async with session.post(
                     OPENROUTER_API_URL,
                     headers={
@@ -424,6 +535,35 @@ async def call_subagent(task: str, model: str = "deepseek/deepseek-chat", max_to
 
 # ─── GitHub API Functions ────────────────────────────────────────
 
+# ETag cache for GitHub GETs: (url, Accept) -> (etag, body bytes).
+# The daemons re-poll the same memory files every few minutes; a conditional
+# request returns 304 with no body on unchanged content and doesn't count
+# against the GitHub rate limit.
+_GITHUB_ETAG_CACHE = {}
+_GITHUB_ETAG_LOCK = threading.Lock()
+
+
+def github_conditional_get(url: str, headers: dict, timeout: int = 10) -> Tuple[int, bytes]:
+    """GET a GitHub API URL with If-None-Match revalidation.
+
+    Returns (status_code, body). A 304 is reported as 200 with the cached body.
+    """
+    key = (url, headers.get("Accept", ""))
+    with _GITHUB_ETAG_LOCK:
+        cached = _GITHUB_ETAG_CACHE.get(key)
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
+    resp = _http.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and cached:
+        return 200, cached[1]
+    if resp.status_code == 200:
+        etag = resp.headers.get("ETag")
+        if etag:
+            with _GITHUB_ETAG_LOCK:
+                _GITHUB_ETAG_CACHE[key] = (etag, resp.content)
+    return resp.status_code, resp.content
+
+
 def fetch_github_file(repo: str, path: str, branch: str = "main") -> str:
     """Fetch file content from GitHub repo."""
     if not GITHUB_PAT:
@@ -432,15 +572,15 @@ def fetch_github_file(repo: str, path: str, branch: str = "main") -> str:
 
     url = f"https://api.github.com/repos/{repo}/contents/{path}?ref={branch}"
     try:
-        resp = requests.get(
+        status_code, body = github_conditional_get(
             url,
             headers={"Authorization": f"token {GITHUB_PAT}", "Accept": "application/vnd.github.v3.raw"},
             timeout=10
         )
-        if resp.status_code == 200:
-            return resp.text
+        if status_code == 200:
+            return body.decode("utf-8", errors="replace")
         else:
-            logger.warning(f"Failed to fetch {repo}/{path}: {resp.status_code}")
+            logger.warning(f"Failed to fetch {repo}/{path}: {status_code}")
             return ""
     except Exception as e:
         logger.error(f"GitHub fetch error: {str(e)}")
@@ -462,7 +602,7 @@ def post_to_discord(message: str, webhook_url: str = None) -> bool:
 
     try:
         payload = {"content": message}
-        resp = requests.post(webhook_url, json=payload, timeout=10)
+        resp = _http.post(webhook_url, json=payload, timeout=10)
         return resp.status_code in [200, 204]
     except Exception as e:
         logger.error(f"Discord post error: {str(e)}")
@@ -678,7 +818,7 @@ def uptime_monitor_daemon():
     def check_cloudfang():
         """Check CloudFang health endpoint."""
         try:
-            resp = requests.get(CLOUDFANG_HEALTH_URL, timeout=5)
+            resp = _http_probe.get(CLOUDFANG_HEALTH_URL, timeout=5)
             is_healthy = resp.status_code == 200
             system_state.cloudfang_healthy = is_healthy
             system_state.cloudfang_last_check = datetime.utcnow().isoformat()
@@ -698,7 +838,7 @@ def uptime_monitor_daemon():
     def check_self():
         """Check self health."""
         try:
-            resp = requests.get(f"http://localhost:{os.environ.get('PORT', 8080)}/health", timeout=5)
+            resp = _http_probe.get(f"http://localhost:{os.environ.get('PORT', 8080)}/health", timeout=5)
             if resp.status_code == 200:
                 system_state.self_uptime = 100.0
             else:
@@ -893,19 +1033,32 @@ Grade: A-F"""
 
 # ─── API Endpoints ───────────────────────────────────────────────
 
+# Serialized /health body, rebuilt at most once per HEALTH_CACHE_TTL.
+# Scrapers and the self-uptime check hit this constantly; the payload only
+# needs second-level freshness.
+HEALTH_CACHE_TTL = 1.0  # seconds
+_health_cache = (0.0, b"")  # (monotonic ts, JSON bytes) — swapped atomically
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint (no auth required)."""
-    return jsonify({
-        "status": "ok",
-        "version": "2.0.0",
-        "model": "deepseek-reasoner",
-        "timestamp": datetime.utcnow().isoformat(),
-        "uptime_seconds": time.time() - system_state.start_time,
-        "gemini_remaining": (
-            gemini_tracker.daily_small_limit - gemini_tracker.small_requests_today
-        )
-    })
+    global _health_cache
+    built_at, body = _health_cache
+    now = time.monotonic()
+    if now - built_at >= HEALTH_CACHE_TTL:
+        body = _json_dumps({
+            "status": "ok",
+            "version": "2.0.0",
+            "model": "deepseek-reasoner",
+            "timestamp": datetime.utcnow().isoformat(),
+            "uptime_seconds": time.time() - system_state.start_time,
+            "gemini_remaining": (
+                gemini_tracker.daily_small_limit - gemini_tracker.small_requests_today
+            )
+        })
+        _health_cache = (now, body)
+    return app.response_class(body, mimetype="application/json")
 
 
 @app.route("/status", methods=["GET"])
@@ -1515,10 +1668,10 @@ def refresh_agent_list():
     """Refresh the known agent list from OpenFang."""
     global KNOWN_AGENT_NAMES
     try:
-        resp = requests.get(f"{OPENFANG_URL}/api/agents",
+        resp = _http.get(f"{OPENFANG_URL}/api/agents",
             headers={"Authorization": f"Bearer {OPENFANG_KEY}"}, timeout=15)
         if resp.status_code == 200:
-            agents = resp.json()
+            agents = _json_loads(resp.content)
             with KNOWN_AGENT_NAMES_LOCK:
                 KNOWN_AGENT_NAMES = {a['name'] for a in agents}
             return agents
@@ -1542,26 +1695,82 @@ DISCORD_CHANNELS = {
 WORK_QUEUE = []
 AUTONOMOUS_LOG = []
 
+# Discord posts run off the caller's thread so daemons and request handlers
+# don't block on the round trip. One single-worker executor per channel: posts
+# to the same channel stay in submission order, posts to different channels
+# go out concurrently over the pooled session.
+_DISCORD_EXECUTORS = {}  # ch_id -> ThreadPoolExecutor(max_workers=1)
+_DISCORD_EXECUTORS_LOCK = threading.Lock()
+
+def _discord_executor(ch_id):
+    with _DISCORD_EXECUTORS_LOCK:
+        executor = _DISCORD_EXECUTORS.get(ch_id)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"discord-{ch_id[-6:]}")
+            _DISCORD_EXECUTORS[ch_id] = executor
+        return executor
+
 def log_to_discord(channel_name, message):
-    """Post a message to a Discord channel."""
-    token = os.getenv('DISCORD_BOT_TOKEN', '')
+    """Post a message to a Discord channel (non-blocking, returns a Future or None)."""
+    token = DISCORD_BOT_TOKEN
     ch_id = DISCORD_CHANNELS.get(channel_name, '')
     if not token or not ch_id:
         logger.warning(f"Discord post skipped (no token/channel): {channel_name}")
-        return
-    try:
-        requests.post(
-            f"https://discord.com/api/v10/channels/{ch_id}/messages",
-            headers={
-                "Authorization": f"Bot {token}",
-                "Content-Type": "application/json",
-                "User-Agent": "DiscordBot (https://openfang.dev, 1.0)"
-            },
-            json={"content": message[:2000]},
-            timeout=10
-        )
-    except Exception as e:
-        logger.warning(f"Discord post failed: {e}")
+        return None
+    return _discord_executor(ch_id).submit(_post_discord_message, ch_id, message, token)
+
+# Per-channel Discord rate-limit state: ch_id -> monotonic time the bucket refills.
+# Fed from X-RateLimit-Remaining / X-RateLimit-Reset-After so we pace sends
+# pre-emptively instead of tripping 429s.
+_DISCORD_RATE_LIMITS = {}
+_DISCORD_RATE_LOCK = threading.Lock()
+
+def _wait_for_discord_bucket(ch_id):
+    with _DISCORD_RATE_LOCK:
+        wait = _DISCORD_RATE_LIMITS.get(ch_id, 0.0) - time.monotonic()
+    if wait > 0:
+        logger.info(f"Discord rate limit: waiting {wait:.2f}s for channel {ch_id}")
+        time.sleep(wait)
+
+def _record_discord_rate_limit(ch_id, resp):
+    """Update the channel bucket from response headers (429 body wins if present)."""
+    reset_after = None
+    if resp.status_code == 429:
+        try:
+            reset_after = float(resp.json().get('retry_after', 1.0))
+        except (ValueError, AttributeError):
+            reset_after = 1.0
+    elif resp.headers.get('X-RateLimit-Remaining') == '0':
+        try:
+            reset_after = float(resp.headers.get('X-RateLimit-Reset-After', 1.0))
+        except ValueError:
+            reset_after = 1.0
+    if reset_after is not None:
+        with _DISCORD_RATE_LOCK:
+            _DISCORD_RATE_LIMITS[ch_id] = time.monotonic() + reset_after
+
+def _post_discord_message(ch_id, message, token):
+    """Blocking Discord REST post — runs on the channel's executor. Retries once on 429."""
+    for attempt in range(2):
+        _wait_for_discord_bucket(ch_id)
+        try:
+            resp = _http.post(
+                f"https://discord.com/api/v10/channels/{ch_id}/messages",
+                headers={
+                    "Authorization": f"Bot {token}",
+                    "Content-Type": "application/json",
+                    "User-Agent": "DiscordBot (https://openfang.dev, 1.0)"
+                },
+                json={"content": message[:2000]},
+                timeout=10
+            )
+        except Exception as e:
+            logger.warning(f"Discord post failed: {e}")
+            return
+        _record_discord_rate_limit(ch_id, resp)
+        if resp.status_code != 429:
+            return
+        logger.warning(f"Discord post rate-limited (429) on channel {ch_id}, attempt {attempt + 1}")
 
 def send_agent_message(agent_key, message, skip_budget=False):
     """Send a message to an agent via OpenFang API. Respects token budget."""
@@ -1570,14 +1779,14 @@ def send_agent_message(agent_key, message, skip_budget=False):
         return {"error": "token_budget_exceeded", "skipped": True}
     agent_id = AGENT_IDS.get(agent_key, agent_key)
     try:
-        resp = requests.post(
+        resp = _http.post(
             f"{OPENFANG_URL}/api/agents/{agent_id}/message",
             headers={"Authorization": f"Bearer {OPENFANG_KEY}", "Content-Type": "application/json"},
             json={"message": message},
             timeout=120
         )
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             # Record actual token usage from response
             usage = data.get('total_usage', {})
             total_tokens = usage.get('total_tokens', 15000)  # Default estimate
@@ -1589,17 +1798,17 @@ def send_agent_message(agent_key, message, skip_budget=False):
 
 def fetch_pending_features():
     """Fetch PENDING_FEATURES.md from GitHub for NOT CODED items."""
-    pat = os.getenv('GITHUB_PAT', GITHUB_PAT)
+    pat = GITHUB_PAT
     if not pat:
         return []
     try:
-        resp = requests.get(
+        status_code, body = github_conditional_get(
             "https://api.github.com/repos/leviathan-devops/leviathan-enhanced-opus/contents/memory/tier2/PENDING_FEATURES.md",
             headers={"Authorization": f"token {pat}"},
             timeout=15
         )
-        if resp.status_code == 200:
-            content = base64.b64decode(resp.json()['content']).decode()
+        if status_code == 200:
+            content = base64.b64decode(_json_loads(body)['content']).decode()
             not_coded = []
             for line in content.split('\n'):
                 if 'NOT CODED' in line or '\U0001f534' in line:
@@ -1652,7 +1861,7 @@ def warm_boot_agent(agent_key):
         role = AGENT_ROLES.get(agent_key, "Unknown role")
 
         # 2. Fetch last 48hrs of T2 memory from GitHub
-        pat = os.getenv('GITHUB_PAT', GITHUB_PAT)
+        pat = GITHUB_PAT
         current_state = ""
         active_bugs = ""
         frustration_triggers = ""
@@ -1787,7 +1996,7 @@ Never:
             logger.info(f"[T2-PROMPT] Using cached semantic summary for {agent_key}")
         else:
             try:
-                resp = requests.post(
+                resp = _http.post(
                     DEEPSEEK_API_URL,
                     headers={"Authorization": f"Bearer {DEEPSEEK_API_KEY}", "Content-Type": "application/json"},
                     json={
@@ -1816,7 +2025,7 @@ Never:
 
         # 3. Store full prompt via OpenFang structured store
         try:
-            store_resp = requests.post(
+            store_resp = _http.post(
                 f"{OPENFANG_URL}/api/agents/{agent_id}/memory",
                 headers=OPENFANG_HEADERS,
                 json={
@@ -1897,16 +2106,56 @@ def t2_prompts_status():
     })
 
 
+def _sleep_until(deadline, interval):
+    """Block until `deadline` (time.monotonic() clock) and return the next deadline.
+
+    Fixed-rate scheduling for daemon loops: cycles fire every `interval` seconds
+    from the first deadline, no matter how long each cycle's network calls took,
+    so stalls don't push later cycles back. Sleeps in slices of at most 60s. If
+    a cycle overruns a whole interval, the missed ticks are skipped rather than
+    fired back-to-back.
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(60, remaining))
+    deadline += interval
+    now = time.monotonic()
+    if deadline <= now:
+        deadline = now + interval
+    return deadline
+
+
+def wait_for_openfang(max_wait=60):
+    """Readiness probe: poll OpenFang /api/health until it returns 200.
+
+    Returns True as soon as the kernel answers, False after `max_wait` seconds.
+    """
+    deadline = time.monotonic() + max_wait
+    while time.monotonic() < deadline:
+        try:
+            # _http_probe: no adapter retries, so each probe really is <=1s
+            if _http_probe.get(f"{OPENFANG_URL}/api/health", timeout=1).status_code == 200:
+                return True
+        except Exception:
+            pass
+        time.sleep(max(0, min(1, deadline - time.monotonic())))
+    logger.warning(f"OpenFang not ready after {max_wait}s, continuing anyway")
+    return False
+
+
 def never_idle_daemon():
     """CORE DAEMON: Every 5 minutes, ensure the system is working on something.
     BUDGET-AWARE: Respects token budget (30 calls/hr max). Won't burn tokens on idle chatter.
     ANTI-DUPLICATE: Checks existing agents before telling CTO to spawn."""
-    time.sleep(60)  # Initial delay to let system boot
+    wait_for_openfang()  # Start as soon as the kernel is up (was a blanket 60s sleep)
     logger.info("[NEVER-IDLE] Autonomous execution engine started (5-min cycle, budget-aware).")
 
     # Track what we've already assigned to avoid re-assigning
     assigned_tasks = set()
     first_cycle = True
+    next_cycle = time.monotonic() + 300
 
     while True:
         try:
@@ -1919,7 +2168,7 @@ def never_idle_daemon():
                     logger.error(f"[NEVER-IDLE] Warm boot failed: {e}")
                 first_cycle = False
 
-            time.sleep(300)  # Check every 5 minutes (was 2min, caused token burn)
+            next_cycle = _sleep_until(next_cycle, 300)  # Check every 5 minutes (was 2min, caused token burn)
 
             # Budget gate — if we've hit the hourly limit, skip entirely
             if not check_token_budget():
@@ -1983,9 +2232,10 @@ def never_idle_daemon():
 def auto_improvement_daemon():
     """Every 2 hours: Lightweight efficiency check. Budget-aware."""
     time.sleep(300)  # Initial delay
+    next_cycle = time.monotonic() + 7200
     while True:
         try:
-            time.sleep(7200)  # Every 2 hours (was 1hr — reduced token burn)
+            next_cycle = _sleep_until(next_cycle, 7200)  # Every 2 hours (was 1hr — reduced token burn)
 
             # Only run if under 50% budget usage
             if TOKEN_BUDGET['calls_this_hour'] > TOKEN_BUDGET['max_calls_per_hour'] * 0.5:
@@ -2629,10 +2879,11 @@ def t3_scribe_daemon():
     95% = second pass (captures any missed context before compaction)."""
     logger.info("T3 Scribe daemon started (5-min cycle, 85%/95% thresholds)")
     first_pass_done = set()  # Track which agents got 85% pass
+    next_cycle = time.monotonic() + 300
 
     while True:
         try:
-            time.sleep(300)
+            next_cycle = _sleep_until(next_cycle, 300)
             if not (t3_history_manager and t3_scribe):
                 continue
             today = datetime.now().strftime("%Y-%m-%d")
@@ -2727,12 +2978,13 @@ def auditor_guardian_daemon():
     """Every 10 minutes: verify Auditor is alive, compact bloated sessions, enforce token limits.
     This is the self-management layer that prevents all 7 kernel root causes."""
     logger.info("Auditor Guardian daemon started (10-min cycle, self-managing)")
+    next_cycle = time.monotonic() + 600
     while True:
         try:
-            time.sleep(600)
+            next_cycle = _sleep_until(next_cycle, 600)
 
             # 1. Check Auditor is alive
-            resp = requests.get(
+            resp = _http.get(
                 f"{OPENFANG_URL}/api/agents/{DELTA_FORCE_AUDITOR_ID}/session",
                 headers={"Authorization": f"Bearer {OPENFANG_KEY}"}, timeout=15
             )
@@ -2748,7 +3000,7 @@ def auditor_guardian_daemon():
                 # 2. Auto-compact Auditor if session >20 messages (prevents T1 bloat)
                 if msg_count > 20:
                     logger.warning(f"Auditor session bloated: {msg_count} msgs. Auto-compacting...")
-                    requests.post(
+                    _http.post(
                         f"{OPENFANG_URL}/api/agents/{DELTA_FORCE_AUDITOR_ID}/session/compact",
                         headers={"Authorization": f"Bearer {OPENFANG_KEY}"}, timeout=30
                     )
@@ -2758,7 +3010,7 @@ def auditor_guardian_daemon():
             cto_id = AGENT_IDS.get('cto')
             if cto_id:
                 try:
-                    cto_resp = requests.get(
+                    cto_resp = _http.get(
                         f"{OPENFANG_URL}/api/agents/{cto_id}/session",
                         headers={"Authorization": f"Bearer {OPENFANG_KEY}"}, timeout=15
                     )
@@ -2767,7 +3019,7 @@ def auditor_guardian_daemon():
                         cto_msgs = cto_session.get('message_count', len(cto_session.get('messages', [])))
                         if cto_msgs > 20:
                             logger.warning(f"CTO session bloated: {cto_msgs} msgs. Auto-compacting...")
-                            requests.post(
+                            _http.post(
                                 f"{OPENFANG_URL}/api/agents/{cto_id}/session/compact",
                                 headers={"Authorization": f"Bearer {OPENFANG_KEY}"}, timeout=30
                             )
@@ -2789,7 +3041,7 @@ def auditor_guardian_daemon():
                         sorted_agents = sorted(agent_list, key=lambda x: x['created_at'], reverse=True)
                         for dup in sorted_agents[1:]:
                             logger.warning(f"Killing duplicate agent: {dup['name']} ({dup['id'][:12]}...)")
-                            requests.delete(
+                            _http.delete(
                                 f"{OPENFANG_URL}/api/agents/{dup['id']}",
                                 headers={"Authorization": f"Bearer {OPENFANG_KEY}"}, timeout=10
                             )
@@ -34,6 +34,7 @@ import asyncio
 import sqlite3
 import hashlib
 import uuid
+import contextlib
 from collections import deque
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -41,6 +42,13 @@ import threading
 import requests
 from flask import Flask, render_template_string, request, jsonify
 
+# Optional uvloop — faster event loop for the Discord bot thread
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Strategic Forgetting v2.9 DMM
 try:
     from memory_manager import DMM_Daemon
@@ -460,11 +468,14 @@ _STOP_WORDS = frozenset({
 })
 
 
+_KEYWORD_TOKEN_RE = re.compile(r'[a-z][a-z0-9_]+')
+
+
 def extract_keywords(text, max_keywords=5):
     """Extract top keywords from text. O(N) scan, no external deps.
     Returns a set of lowercase keyword strings (max 5)."""
     # Tokenize: split on non-alphanumeric, lowercase
-    words = re.findall(r'[a-z][a-z0-9_]+', text.lower())
+    words = _KEYWORD_TOKEN_RE.findall(text.lower())
     # Filter stop words and very short words
     meaningful = [w for w in words if w not in _STOP_WORDS and len(w) > 2]
     # Count frequency
@@ -615,11 +626,12 @@ SLOP_KEYWORDS = frozenset({
 })
 
 # Patterns that indicate the bot is roleplaying wrong
+# (compiled pattern, suppressed in trading context)
 SLOP_PATTERNS = [
-    r'(?i)i am (?:the entire|all|every) (?:hydra|team|system)',
-    r'(?i)(?:claude|gpt|gemini) (?:here|speaking|reporting)',
-    r'(?i)\b\d{3,4}x (?:returns?|gains?|profit)',
-    r'(?i)\b(?:9[5-9]|100)% (?:accurate|success|win)',
+    (re.compile(r'(?i)i am (?:the entire|all|every) (?:hydra|team|system)'), False),
+    (re.compile(r'(?i)(?:claude|gpt|gemini) (?:here|speaking|reporting)'), False),
+    (re.compile(r'(?i)\b\d{3,4}x (?:returns?|gains?|profit)'), True),
+    (re.compile(r'(?i)\b(?:9[5-9]|100)% (?:accurate|success|win)'), True),
 ]
 
 BUG_CHANNEL_NAME = 'bug-identification'
@@ -655,12 +667,12 @@ def detect_slop(text):
             triggers.append(f'keyword: "{kw}"')
 
     # Pattern scan — suppress high-percentage and return patterns in trading context
-    for pat in SLOP_PATTERNS:
+    for pat, trading_suppressed in SLOP_PATTERNS:
         # Skip percentage/return patterns in trading context
-        if is_trading_context and (r'\d{3,4}x' in pat or r'(?:9[5-9]|100)%' in pat):
+        if is_trading_context and trading_suppressed:
             continue
-        if re.search(pat, text):
-            triggers.append(f'pattern: {pat[:40]}')
+        if pat.search(text):
+            triggers.append(f'pattern: {pat.pattern[:40]}')
 
     return triggers
 
@@ -2669,6 +2681,14 @@ discord_bot = None
 _discord_lock_file = None
 _processed_messages = {}  # message_id → timestamp, dedup cache to prevent multi-fire
 
+# Voice-to-text fix for on_message, compiled once (runs on every inbound message)
+_HYDRO_POD_RE = re.compile(r'\b([Hh])ydro\s+[Pp]od(s?)\b')
+
+
+def _fix_hydro_pod(m):
+    return ('Hydra Pod' if m.group(1) == 'H' else 'hydra pod') + m.group(2)
+
+
 def start_discord_bot():
     """Run Discord bot in background thread alongside Flask.
     Uses file lock so only ONE gunicorn worker runs the bot (prevents duplicate replies).
@@ -2698,6 +2718,11 @@ def start_discord_bot():
 
     intents = discord.Intents.default()
     intents.message_content = True
+    # Only on_ready/on_message + slash commands are handled — drop gateway
+    # events we never consume so discord.py doesn't parse and dispatch them.
+    intents.typing = False
+    intents.reactions = False
+    intents.voice_states = False
     bot = discord.Client(intents=intents)
     tree = discord.app_commands.CommandTree(bot)
     discord_bot = bot
@@ -2705,25 +2730,51 @@ def start_discord_bot():
     target_guild = discord.Object(id=DISCORD_GUILD_ID)
 
     # ── Helper: send a long response, chunked if needed ──
+    def _iter_chunks(text):
+        """Yield ≤2000-char chunks, preferring newline boundaries. Lazy — no chunk list."""
+        start = 0
+        end = len(text)
+        while start < end:
+            if end - start <= 2000:
+                yield text[start:]
+                return
+            split_at = text.rfind('\n', start, start + 1990)
+            if split_at - start < 500:
+                split_at = start + 1990
+            yield text[start:split_at]
+            # Skip leading whitespace of the next chunk (same as .lstrip())
+            start = split_at
+            while start < end and text[start].isspace():
+                start += 1
+
+    @contextlib.asynccontextmanager
+    async def _typing_indicator(channel):
+        """channel.typing(), but a failed typing POST never aborts the reply."""
+        typing_ctx = channel.typing()
+        try:
+            await typing_ctx.__aenter__()
+        except Exception as e:
+            logger.warning(f"Typing indicator failed: {e}")
+            yield
+            return
+        try:
+            yield
+        finally:
+            await typing_ctx.__aexit__(None, None, None)
+
     async def _send_response(send_func, followup_func, text):
-        """Send text, chunking at 2000 chars if needed."""
+        """Send text, chunking at 2000 chars if needed.
+
+        Chunks are awaited in order on purpose: concurrent sends have no ordering
+        guarantee in Discord, and discord.py already paces them per rate-limit bucket.
+        """
         if len(text) <= 2000:
             await send_func(text)
-        else:
-            chunks = []
-            remaining = text
-            while remaining:
-                if len(remaining) <= 2000:
-                    chunks.append(remaining)
-                    break
-                split_at = remaining.rfind('\n', 0, 1990)
-                if split_at < 500:
-                    split_at = 1990
-                chunks.append(remaining[:split_at])
-                remaining = remaining[split_at:].lstrip()
-            await send_func(chunks[0])
-            for chunk in chunks[1:]:
-                await followup_func(chunk)
+            return
+        sender = send_func
+        for chunk in _iter_chunks(text):
+            await sender(chunk)
+            sender = followup_func
 
     # ── /memory slash command (inspect Hydra memory) ─────────
     @tree.command(name="memory", description="View the Hydra's persistent memory stats and recent builds", guild=target_guild)
@@ -3000,6 +3051,9 @@ def start_discord_bot():
     async def on_message(message):
         if message.author == bot.user:
             return
+        # Cheapest rejection first: nothing to act on (embeds, joins, stickers)
+        if not message.content and not message.attachments:
+            return
 
         # ── DEDUP GUARD: Prevent multi-fire on same message ──
         msg_id = str(message.id)
@@ -3007,10 +3061,10 @@ def start_discord_bot():
             logger.warning(f"[DEDUP] Skipping already-processed message {msg_id}")
             return
         _processed_messages[msg_id] = time.time()
-        # Prune old entries (keep last 100)
+        # Prune old entries (keep last 100). Dicts keep insertion order, so the
+        # first keys are the oldest — no sort needed.
         if len(_processed_messages) > 100:
-            oldest_keys = sorted(_processed_messages, key=_processed_messages.get)[:50]
-            for k in oldest_keys:
+            for k in list(_processed_messages)[:50]:
                 del _processed_messages[k]
 
         # Strip mentions if present
@@ -3022,9 +3076,8 @@ def start_discord_bot():
 
         # ── VOICE-TO-TEXT TYPO CORRECTION ──
         # "Hydro pod" is a common voice-to-text error for "Hydra pod"
-        import re
-        content = re.sub(r'\b[Hh]ydro\s+[Pp]od\b', lambda m: 'Hydra Pod' if m.group()[0].isupper() else 'hydra pod', content)
-        content = re.sub(r'\b[Hh]ydro\s+[Pp]ods\b', lambda m: 'Hydra Pods' if m.group()[0].isupper() else 'hydra pods', content)
+        if 'ydro' in content:
+            content = _HYDRO_POD_RE.sub(_fix_hydro_pod, content)
 
         # Read any attached text files and append to message
         if message.attachments:
@@ -3045,10 +3098,15 @@ def start_discord_bot():
             dmm_daemon.record_message(channel_id, msg_time)
 
         # Regular messages always go through fast path (never build)
-        async with message.channel.typing():
-            loop = asyncio.get_event_loop()
+        # Submit the pipeline before entering typing() so the typing POST and the
+        # model call overlap instead of paying the typing round trip first.
+        # _typing_indicator swallows typing errors, so pipeline_future is always
+        # awaited (and its result/exception collected) inside the try below.
+        loop = asyncio.get_event_loop()
+        pipeline_future = loop.run_in_executor(None, run_pipeline, content, channel_id)
+        async with _typing_indicator(message.channel):
             try:
-                result = await loop.run_in_executor(None, run_pipeline, content, channel_id)
+                result = await pipeline_future
                 response_text = result.get('response', 'No response generated.')
                 models = result.get('models_used', [])
                 proc_time = result.get('processing_time', '?')
@@ -3130,7 +3188,7 @@ def start_discord_bot():
                 await message.reply(f"Error: {str(e)[:200]}")
 
     def _run_bot():
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             loop.run_until_complete(bot.start(DISCORD_TOKEN))